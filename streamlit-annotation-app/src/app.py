@@ -1,15 +1,33 @@
 import streamlit as st
-import pandas as pd
-import json
-from pathlib import Path
+import csv
 import hashlib
+import itertools
+import mistune
+import os
+import orjson
+import polars as pl
+import simdjson
+from pathlib import Path
+from urllib.parse import quote
 
 # ============================================================================
 # Configuration
 # ============================================================================
 DATA_DIR = Path(__file__).parent.parent / "data"
 SPEECHES_FILE = DATA_DIR / "sampled_speeches.json"
-ANNOTATIONS_FILE = DATA_DIR / "annotations.csv"
+ANNOTATIONS_DIR = DATA_DIR / "annotations"
+MAX_SHARD_NAME_LENGTH = 64  # readable part of a shard file name, in bytes
+MERGED_ANNOTATIONS_FILE = DATA_DIR / "annotations_merged.csv"
+# Single CSV used before per-rater shards; imported once per rater on first load
+LEGACY_ANNOTATIONS_FILE = DATA_DIR / "annotations.csv"
+ANNOTATION_SCHEMA = {
+    "item_id": pl.String,
+    "rater_id": pl.String,
+    "score": pl.Int64,
+    "justification": pl.String,
+    "context": pl.String,
+    "statement": pl.String
+}
 
 # TEST MODE: Set to True to only load 3 speeches for testing
 TEST_MODE = False #True
@@ -18,111 +36,340 @@ TEST_SPEECHES_COUNT = 3
 # ============================================================================
 # Data Handling
 # ============================================================================
+class _LazySpeeches:
+    """
+    Read-only, list-like view over the parsed speeches array.
+    
+    The JSON stays in simdjson's document; a speech is only converted to a
+    Python dict the first time it is accessed by index. At that point the
+    context strings used for display and for saving are joined once and
+    stored as '_context_display' and '_context_joined'.
+    """
+    
+    def __init__(self, parser, array, count):
+        self._parser = parser  # keeps the parsed document alive
+        self._array = array
+        self._count = count
+        self._materialized = {}
+    
+    def __len__(self):
+        return self._count
+    
+    def __getitem__(self, idx):
+        if not 0 <= idx < self._count:
+            raise IndexError(idx)
+        speech = self._materialized.get(idx)
+        if speech is None:
+            speech = self._array[idx].as_dict()
+            context = speech.get('context') or []
+            speech['_context_display'] = "\n\n".join([f"{i+1}. {ctx}" for i, ctx in enumerate(context)])
+            speech['_context_joined'] = " | ".join(context)
+            self._materialized[idx] = speech
+        return speech
+    
+    def speech_ids(self):
+        """Return all speech IDs without materializing the speeches."""
+        # Iterate rather than index: simdjson array indexing is linear in idx
+        return [s['speech_id'] for s in itertools.islice(self._array, self._count)]
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _parse_speeches(mtime, test_mode):
+    """Parse the speeches JSON file once per (mtime, test_mode).
+    
+    The returned speeches are shared across reruns and sessions, so callers
+    must treat them as read-only.
+    """
+    parser = simdjson.Parser()
+    speeches = parser.parse(SPEECHES_FILE.read_bytes())['speeches']
+    count = len(speeches)
+    
+    # In test mode, only return first N speeches
+    if test_mode:
+        count = min(count, TEST_SPEECHES_COUNT)
+    
+    return _LazySpeeches(parser, speeches, count)
+
 def load_speeches():
-    """Load speeches from JSON file."""
+    """Load speeches from JSON file (cached until the file changes)."""
     try:
-        with open(SPEECHES_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        speeches = data['speeches']
-        
-        # In test mode, only return first N speeches
-        if TEST_MODE:
-            speeches = speeches[:TEST_SPEECHES_COUNT]
-        
-        return speeches
+        return _parse_speeches(SPEECHES_FILE.stat().st_mtime, TEST_MODE)
     except FileNotFoundError:
         st.error(f"❌ File not found: {SPEECHES_FILE}")
         st.info("Please copy sampled_speeches.json to the data/ directory")
         st.stop()
-    except json.JSONDecodeError:
+    except ValueError:
         st.error(f"❌ Invalid JSON file: {SPEECHES_FILE}")
         st.info("The JSON file appears to be empty or corrupted.")
         st.stop()
 
+def _rater_file(rater_id):
+    """
+    Path of the JSONL shard holding one rater's annotations.
+    
+    The rater ID is percent-encoded (including '~') so it is a safe file name.
+    IDs whose encoding is long, or which contain uppercase letters, get a
+    '~'-separated hash suffix instead: this keeps the name within filesystem
+    limits and distinct on case-insensitive filesystems ("Alice" vs "alice").
+    """
+    name = quote(rater_id, safe='').replace('~', '%7E')
+    if len(name) > MAX_SHARD_NAME_LENGTH or rater_id != rater_id.lower():
+        digest = hashlib.sha256(rater_id.encode('utf-8')).hexdigest()[:16]
+        name = f"{name[:MAX_SHARD_NAME_LENGTH].lower()}~{digest}"
+    return ANNOTATIONS_DIR / f"{name}.jsonl"
+
+def _import_legacy_annotations(rater_id, path):
+    """
+    Copy this rater's rows from the legacy annotations CSV into their shard.
+    
+    Later rows win for duplicate item_ids, and rows without a valid score are
+    skipped. Returns True if a shard was written.
+    """
+    rows = {}
+    with open(LEGACY_ANNOTATIONS_FILE, 'r', newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            if row.get('rater_id') != rater_id:
+                continue
+            try:
+                score = int(float(row['score']))
+            except (KeyError, TypeError, ValueError):
+                continue
+            rows[row['item_id']] = {
+                "item_id": row['item_id'],
+                "rater_id": rater_id,
+                "score": score,
+                "justification": row.get('justification') or "",
+                "context": row.get('context') or "",
+                "statement": row.get('statement') or ""
+            }
+    
+    if not rows:
+        return False
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.jsonl.tmp')
+    with open(tmp, 'wb', buffering=1 << 20) as f:
+        f.writelines(orjson.dumps(r) + b"\n" for r in rows.values())
+    os.replace(tmp, path)
+    return True
+
+def _load_annotations(rater_id):
+    """
+    Return this rater's annotations as a dict: item_id -> row.
+    
+    Each rater's shard is parsed once per session into st.session_state and
+    only re-read when its mtime changes (e.g. the same rater saved from
+    another tab).
+    """
+    path = _rater_file(rater_id)
+    by_rater = st.session_state.setdefault('annotations_by_rater', {})
+    mtimes = st.session_state.setdefault('annotations_mtime', {})
+    
+    # A rater without a shard may still have annotations in the legacy CSV
+    if rater_id not in by_rater and not path.exists() and LEGACY_ANNOTATIONS_FILE.exists():
+        _import_legacy_annotations(rater_id, path)
+    
+    mtime = path.stat().st_mtime if path.exists() else None
+    
+    if rater_id not in by_rater or mtimes.get(rater_id) != mtime:
+        rows = {}
+        if mtime is not None:
+            with open(path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    row = orjson.loads(line)
+                    rows[row['item_id']] = row
+        by_rater[rater_id] = rows
+        mtimes[rater_id] = mtime
+        # Progress must be recounted against the reloaded annotations
+        st.session_state.pop('completed_count', None)
+    
+    return by_rater[rater_id]
+
 def get_annotation(item_id, rater_id):
-    """Get specific annotation for this item_id + rater_id combination."""
-    if not ANNOTATIONS_FILE.exists():
-        return None
+    """Get specific annotation for this item_id + rater_id combination.
     
+    Returns the stored row itself (read-only), or None if not annotated yet.
+    """
     try:
-        df = pd.read_csv(ANNOTATIONS_FILE)
-        mask = (df['item_id'] == item_id) & (df['rater_id'] == rater_id)
-        
-        if mask.any():
-            row = df[mask].iloc[0]
-            return {
-                'score': int(row['score']),
-                'justification': str(row['justification'])
-            }
+        return _load_annotations(rater_id).get(item_id)
     except Exception as e:
         st.error(f"Error reading annotations: {e}")
-    
-    return None
+        return None
 
 def get_annotations_for_rater(rater_id):
     """Get all annotations by this rater as a dict indexed by item_id."""
-    if not ANNOTATIONS_FILE.exists():
-        return {}
-    
     try:
-        df = pd.read_csv(ANNOTATIONS_FILE)
-        rater_df = df[df['rater_id'] == rater_id]
-        
-        annotations = {}
-        for _, row in rater_df.iterrows():
-            annotations[row['item_id']] = {
-                'score': int(row['score']),
-                'justification': row['justification']
-            }
-        
-        return annotations
+        return _load_annotations(rater_id)
     except Exception as e:
         st.error(f"Error reading annotations: {e}")
         return {}
 
 def update_annotation(item_id, rater_id, score, justification, context, statement):
     """Update existing annotation or create new one."""
-    if not ANNOTATIONS_FILE.exists():
-        # Create new file with this annotation
-        annotation = {
-            "item_id": item_id,
-            "rater_id": rater_id,
-            "score": score,
-            "justification": justification,
-            "context": context,
-            "statement": statement
-        }
-        df = pd.DataFrame([annotation])
-        ANNOTATIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(ANNOTATIONS_FILE, index=False)
-        return
-    
-    df = pd.read_csv(ANNOTATIONS_FILE)
-    
-    # Check if annotation exists
-    mask = (df['item_id'] == item_id) & (df['rater_id'] == rater_id)
-    
-    if mask.any():
-        # Update existing row - OVERWRITE the data
-        df.loc[mask, 'score'] = score
-        df.loc[mask, 'justification'] = justification
-        df.loc[mask, 'context'] = context
-        df.loc[mask, 'statement'] = statement
+    path = _rater_file(rater_id)
+    rows = _load_annotations(rater_id)
+    exists = item_id in rows
+    row = {
+        "item_id": item_id,
+        "rater_id": rater_id,
+        "score": score,
+        "justification": justification,
+        "context": context,
+        "statement": statement
+    }
+    
+    # The session index is only updated once the write has succeeded, so a
+    # failed save never shows up as a saved annotation
+    if exists:
+        # Update existing row - rewrite this rater's file with the overwritten
+        # data into a temp file and swap it in, so a crash never leaves a
+        # half-written shard behind
+        tmp = path.with_suffix('.jsonl.tmp')
+        with open(tmp, 'wb', buffering=1 << 20) as f:
+            f.writelines(orjson.dumps(r) + b"\n" for r in {**rows, item_id: row}.values())
+        os.replace(tmp, path)
+    else:
+        # New row - append a single JSON line
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'ab') as f:
+            f.write(orjson.dumps(row) + b"\n")
+    rows[item_id] = row
+    
+    # Our own write must not trigger a re-parse on the next rerun
+    st.session_state['annotations_mtime'][rater_id] = path.stat().st_mtime
+
+def merge_all(out_path=MERGED_ANNOTATIONS_FILE):
+    """
+    Concatenate all rater shards into a single CSV for downstream analysis.
+    
+    The shards are scanned lazily and streamed to disk by polars in batches,
+    so the full set of annotations is never held in memory. Row order across
+    shards is not preserved. Returns the path written to.
+    """
+    shards = sorted(ANNOTATIONS_DIR.glob("*.jsonl"))
+    if shards:
+        annotations = pl.scan_ndjson(shards, schema=ANNOTATION_SCHEMA)
     else:
-        # Append new row
-        new_row = pd.DataFrame([{
-            "item_id": item_id,
-            "rater_id": rater_id,
-            "score": score,
-            "justification": justification,
-            "context": context,
-            "statement": statement
-        }])
-        df = pd.concat([df, new_row], ignore_index=True)
-    
-    # Save back to file
-    df.to_csv(ANNOTATIONS_FILE, index=False)
+        annotations = pl.LazyFrame(schema=ANNOTATION_SCHEMA)
+    annotations.sink_csv(out_path, batch_size=4096, maintain_order=False)
+    return out_path
+
+# ============================================================================
+# Static Content
+# ============================================================================
+INTRO_MD = """
+## Welcome,
+
+You are assisting a research study on **deliberative communication**. Your task is to assess how much 
+a given speech act demonstrates **domain expertise** on the topic under discussion.
+
+### What is "Expertise"?
+
+"Expertise" here refers to the expression of **specialized knowledge**, **technical accuracy**, 
+and the ability to **reason with evidence or well-informed arguments**, as shown through language use.
+
+### Your Task
+
+You will evaluate speaker statements in the context of ongoing deliberations. Please refer to the 
+**previous context** to assess how the current speech act signifies expertise in the current discussion topics.
+
+⚠️ *Note: The input may include minor transcription errors (from speech-to-text).*
+
+### Linguistic Indicators of Expertise
+
+When deciding, rely on well-established linguistic indicators such as:
+
+- **Domain-specific or technical vocabulary** (precision, correct terminology)
+
+- **Structured reasoning and inferential coherence**, including:
+  - *Cause–effect:* because, since, therefore, thus, hence
+  - *Entailment or consequence:* it follows that, as a consequence, this implies that
+  - *Conditional inference:* if … then …, given that … we can conclude …
+  - *Syllogistic reasoning:* all X are Y; this is X; therefore …
+
+- **Evidence or citation markers** (according to, studies show, data suggest)
+
+- **Epistemic calibration** (balanced use of hedges like "may", "might", "suggests", showing awareness of uncertainty)
+
+- **Syntactic and lexical complexity** (varied sentence structure, advanced word choice)
+
+- **Analytical focus over personal anecdote or emotion**
+
+- **Relevance to current topic** (staying on-topic with informed contributions)
+
+### What to Avoid
+
+❌ Do **NOT** judge based on:
+- Fluency or confidence tone
+- Opinion alignment
+- Personal agreement with the content
+
+✅ Focus purely on **linguistic cues** that signal expertise or informed reasoning.
+
+### Rating Scale (1–5 Likert)
+
+**1** — Strongly Disagree: clearly non-expert  
+*(uninformed, vague, anecdotal, incorrect, or purely emotional)*
+
+**2** — Disagree: likely non-expert  
+*(limited reasoning, lacks technical or evidential language)*
+
+**3** — Undecided: ambiguous or generic statement  
+*(no clear expert or non-expert cues)*
+
+**4** — Agree: likely expert  
+*(some specialized reasoning, accurate and structured)*
+
+**5** — Strongly Agree: clearly expert  
+*(precise terminology, well-reasoned, supported by evidence)*
+
+### Justification
+
+For each rating, provide a **one-sentence justification** referencing specific linguistic or reasoning cues.
+
+---
+"""
+
+RATING_SCALE_MD = """
+**1** — No expertise  
+*(vague, anecdotal, emotional)*
+
+**2** — Minimal expertise  
+*(limited reasoning, lacks technical language)*
+
+**3** — Moderate expertise  
+*(ambiguous, no clear expert cues)*
+
+**4** — Strong expertise  
+*(specialized reasoning, accurate)*
+
+**5** — Very strong expertise  
+*(precise terminology, well-reasoned)*
+"""
+
+LOOK_FOR_MD = """
+**Indicators of expertise:**
+- Domain-specific vocabulary
+- Structured reasoning:
+  - Cause-effect (because, thus)
+  - Conditional (if...then)
+  - Evidence markers (studies show)
+- Epistemic hedges (may, might, suggests)
+- Syntactic complexity
+- Analytical vs. emotional focus
+- Topic relevance
+
+**Avoid judging:**
+- Fluency or confidence tone
+- Opinion alignment
+- Personal agreement
+"""
+
+@st.cache_resource(show_spinner=False)
+def _markdown_html(text):
+    """Render static markdown to HTML once per process."""
+    return mistune.html(text)
 
 # ============================================================================
 # UI Components
@@ -136,78 +383,7 @@ def show_introduction():
     
     st.markdown("---")
     
-    st.markdown("""
-    ## Welcome,
-    
-    You are assisting a research study on **deliberative communication**. Your task is to assess how much 
-    a given speech act demonstrates **domain expertise** on the topic under discussion.
-    
-    ### What is "Expertise"?
-    
-    "Expertise" here refers to the expression of **specialized knowledge**, **technical accuracy**, 
-    and the ability to **reason with evidence or well-informed arguments**, as shown through language use.
-    
-    ### Your Task
-    
-    You will evaluate speaker statements in the context of ongoing deliberations. Please refer to the 
-    **previous context** to assess how the current speech act signifies expertise in the current discussion topics.
-    
-    ⚠️ *Note: The input may include minor transcription errors (from speech-to-text).*
-    
-    ### Linguistic Indicators of Expertise
-    
-    When deciding, rely on well-established linguistic indicators such as:
-    
-    - **Domain-specific or technical vocabulary** (precision, correct terminology)
-    
-    - **Structured reasoning and inferential coherence**, including:
-      - *Cause–effect:* because, since, therefore, thus, hence
-      - *Entailment or consequence:* it follows that, as a consequence, this implies that
-      - *Conditional inference:* if … then …, given that … we can conclude …
-      - *Syllogistic reasoning:* all X are Y; this is X; therefore …
-    
-    - **Evidence or citation markers** (according to, studies show, data suggest)
-    
-    - **Epistemic calibration** (balanced use of hedges like "may", "might", "suggests", showing awareness of uncertainty)
-    
-    - **Syntactic and lexical complexity** (varied sentence structure, advanced word choice)
-    
-    - **Analytical focus over personal anecdote or emotion**
-    
-    - **Relevance to current topic** (staying on-topic with informed contributions)
-    
-    ### What to Avoid
-    
-    ❌ Do **NOT** judge based on:
-    - Fluency or confidence tone
-    - Opinion alignment
-    - Personal agreement with the content
-    
-    ✅ Focus purely on **linguistic cues** that signal expertise or informed reasoning.
-    
-    ### Rating Scale (1–5 Likert)
-    
-    **1** — Strongly Disagree: clearly non-expert  
-    *(uninformed, vague, anecdotal, incorrect, or purely emotional)*
-    
-    **2** — Disagree: likely non-expert  
-    *(limited reasoning, lacks technical or evidential language)*
-    
-    **3** — Undecided: ambiguous or generic statement  
-    *(no clear expert or non-expert cues)*
-    
-    **4** — Agree: likely expert  
-    *(some specialized reasoning, accurate and structured)*
-    
-    **5** — Strongly Agree: clearly expert  
-    *(precise terminology, well-reasoned, supported by evidence)*
-    
-    ### Justification
-    
-    For each rating, provide a **one-sentence justification** referencing specific linguistic or reasoning cues.
-    
-    ---
-    """)
+    st.html(_markdown_html(INTRO_MD))
     
     col1, col2, col3 = st.columns([1, 1, 1])
     with col2:
@@ -215,11 +391,10 @@ def show_introduction():
             st.session_state.show_intro = False
             st.rerun()
 
-def display_context(context):
-    """Display context speeches - always visible."""
+def display_context(context_text):
+    """Display pre-joined context speeches - always visible."""
     st.markdown("#### 📝 Previous Context")
-    if context:
-        context_text = "\n\n".join([f"{i+1}. {ctx}" for i, ctx in enumerate(context)])
+    if context_text:
         st.text_area(
             "Context speeches:",
             value=context_text,
@@ -238,7 +413,7 @@ def display_speech(speech, idx, total):
     st.markdown("---")
     
     # Display context first (always visible)
-    display_context(speech['context'])
+    display_context(speech['_context_display'])
     
     st.markdown("---")
     
@@ -259,6 +434,9 @@ def main():
         st.session_state.current_idx = 0
     if 'rater_id' not in st.session_state:
         st.session_state.rater_id = ""
+    # Re-assign the widget-owned key so it survives runs where the sidebar
+    # input is not rendered (e.g. while the introduction is shown)
+    st.session_state.rater_id = st.session_state.rater_id
     
     # Show introduction page first
     if st.session_state.show_intro:
@@ -277,17 +455,8 @@ def main():
     with st.sidebar:
         st.header("👤 Rater Information")
         
-        # Use session state to persist rater_id
-        rater_id_input = st.text_input(
-            "Enter your Rater ID:", 
-            value=st.session_state.rater_id,
-            key="rater_id_input"
-        )
-        
-        # Update session state when input changes
-        if rater_id_input != st.session_state.rater_id:
-            st.session_state.rater_id = rater_id_input
-            st.rerun()
+        # The widget key is the single source of truth for rater_id
+        st.text_input("Enter your Rater ID:", key="rater_id")
         
         rater_id = st.session_state.rater_id
         
@@ -302,42 +471,11 @@ def main():
         
         st.markdown("---")
         st.markdown("### 📊 Expertise Rating Scale")
-        st.markdown("""
-        **1** — No expertise  
-        *(vague, anecdotal, emotional)*
-        
-        **2** — Minimal expertise  
-        *(limited reasoning, lacks technical language)*
-        
-        **3** — Moderate expertise  
-        *(ambiguous, no clear expert cues)*
-        
-        **4** — Strong expertise  
-        *(specialized reasoning, accurate)*
-        
-        **5** — Very strong expertise  
-        *(precise terminology, well-reasoned)*
-        """)
+        st.html(_markdown_html(RATING_SCALE_MD))
         
         st.markdown("---")
         st.markdown("### 🔍 What to Look For")
-        st.markdown("""
-        **Indicators of expertise:**
-        - Domain-specific vocabulary
-        - Structured reasoning:
-          - Cause-effect (because, thus)
-          - Conditional (if...then)
-          - Evidence markers (studies show)
-        - Epistemic hedges (may, might, suggests)
-        - Syntactic complexity
-        - Analytical vs. emotional focus
-        - Topic relevance
-        
-        **Avoid judging:**
-        - Fluency or confidence tone
-        - Opinion alignment
-        - Personal agreement
-        """)
+        st.html(_markdown_html(LOOK_FOR_MD))
         
         if st.button("📖 Show Instructions Again"):
             st.session_state.show_intro = True
@@ -350,11 +488,18 @@ def main():
     # Get existing annotations for this rater
     annotations = get_annotations_for_rater(rater_id)
     
-    # Get list of speech IDs we're actually working with
-    speech_ids_to_annotate = [s['speech_id'] for s in speeches]
+    # Get list of speech IDs we're actually working with (once per loaded file)
+    if st.session_state.get('speech_ids_source') is not speeches:
+        st.session_state.speech_ids = speeches.speech_ids()
+        st.session_state.speech_ids_source = speeches
+        st.session_state.pop('completed_count', None)
     
-    # Count how many of THESE speeches have been annotated
-    completed = sum(1 for sid in speech_ids_to_annotate if sid in annotations)
+    # Count how many of THESE speeches have been annotated; the count is kept
+    # up to date by the submit handler and only rescanned when invalidated
+    if st.session_state.get('completed_rater') != rater_id or 'completed_count' not in st.session_state:
+        st.session_state.completed_count = sum(1 for sid in st.session_state.speech_ids if sid in annotations)
+        st.session_state.completed_rater = rater_id
+    completed = st.session_state.completed_count
     
     st.markdown(f"### Progress: {completed}/{total_speeches} speeches annotated")
     st.progress(completed / total_speeches if total_speeches > 0 else 0)
@@ -367,7 +512,7 @@ def main():
         col1, col2, col3 = st.columns([1, 1, 1])
         with col2:
             if st.button("✅ Finish and Close", type="primary", use_container_width=True):
-                st.success(f"✅ All annotations saved to {ANNOTATIONS_FILE}")
+                st.success(f"✅ All annotations saved to {_rater_file(rater_id)}")
                 st.info("You can now close this browser tab.")
                 # Close the app by stopping execution
                 st.stop()
@@ -409,19 +554,15 @@ def main():
     # Annotation form
     st.markdown("### ✍️ Your Annotation")
     
-    # FETCH existing annotation from CSV for this specific speech_id + rater_id
+    # FETCH existing annotation from the annotations file for this specific speech_id + rater_id
     existing = get_annotation(current_speech['speech_id'], rater_id)
     
     # Use existing values if present, otherwise use neutral defaults
     default_score = existing['score'] if existing else 3
     default_justification = existing['justification'] if existing else ''
     
-    # Create a stable hash for the form key (avoid special characters)
-    speech_hash = hashlib.md5(
-        f"{current_speech['speech_id']}_{rater_id}_{current_idx}".encode()
-    ).hexdigest()[:8]
-    
-    form_key = f"annotation_form_{speech_hash}"
+    # Stable form key per speech + rater so the widgets refresh on navigation
+    form_key = f"annotation_form_{current_speech['speech_id']}_{rater_id}"
     
     with st.form(key=form_key):
         col1, col2 = st.columns([1, 3])
@@ -450,17 +591,20 @@ def main():
                 st.error("❌ Please provide a justification for your score")
             else:
                 # Save/update annotation (will OVERWRITE if exists)
-                context_str = " | ".join(current_speech['context']) if current_speech['context'] else ""
-                
                 update_annotation(
                     current_speech['speech_id'],
                     rater_id,
                     score,
                     justification.strip(),
-                    context_str,
+                    current_speech['_context_joined'],
                     current_speech['text']
                 )
                 
+                # Count only first-time annotations (the count may have been
+                # invalidated if the file was reloaded during the update)
+                if existing is None and 'completed_count' in st.session_state:
+                    st.session_state.completed_count += 1
+                
                 st.success("✅ Annotation saved!")
                 
                 # Auto-advance to next speech if not at the end
@@ -1,5 +1,5 @@
+import csv
 from streamlit import st
-import pandas as pd
 
 def annotation_form(speech_id, context, statement):
     with st.form(key='annotation_form'):
@@ -11,27 +11,12 @@ def annotation_form(speech_id, context, statement):
         
         if submit_button:
             if rater_id and justification:
-                # Load existing annotations
-                try:
-                    annotations = pd.read_csv('data/annotations.csv')
-                except FileNotFoundError:
-                    annotations = pd.DataFrame(columns=['item_id', 'rater_id', 'score', 'justification', 'context', 'statement'])
-                
-                # Create a new annotation entry
-                new_annotation = {
-                    'item_id': speech_id,
-                    'rater_id': rater_id,
-                    'score': score,
-                    'justification': justification,
-                    'context': context,
-                    'statement': statement
-                }
-                
-                # Append the new annotation to the DataFrame
-                annotations = annotations.append(new_annotation, ignore_index=True)
-                
-                # Save the updated annotations to CSV
-                annotations.to_csv('data/annotations.csv', index=False)
+                # Append the new annotation, writing the header on first use
+                with open('data/annotations.csv', 'a', newline='', encoding='utf-8') as file:
+                    writer = csv.writer(file)
+                    if file.tell() == 0:
+                        writer.writerow(['item_id', 'rater_id', 'score', 'justification', 'context', 'statement'])
+                    writer.writerow([speech_id, rater_id, score, justification, context, statement])
                 
                 st.success("Annotation submitted successfully!")
             else:
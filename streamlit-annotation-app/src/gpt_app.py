@@ -10,6 +10,18 @@ DATA_DIR = Path(__file__).parent.parent / "data"
 SPEECHES_FILE = DATA_DIR / "sampled_speeches.json"
 ANNOTATIONS_FILE = DATA_DIR / "annotations.csv"
 
+# Explicit dtypes skip read_csv's per-column type inference
+ANNOT_DTYPES = {
+    "item_id": "string",
+    "rater_id": "string",
+    "score": "Int8",  # nullable, so blank cells don't fail the parse
+    "justification": "string",
+    "context": "string",
+    "statement": "string"
+}
+# Columns needed for lookups (context/statement are only needed when rewriting)
+LOOKUP_COLUMNS = ("item_id", "rater_id", "score", "justification")
+
 # TEST MODE: Set to True to only load N speeches for testing
 TEST_MODE = True
 TEST_SPEECHES_COUNT = 3
@@ -39,6 +51,21 @@ def load_speeches():
         st.info("The JSON file appears to be empty or corrupted.")
         st.stop()
 
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _read_annotations(mtime: float):
+    """
+    Parse the lookup columns of the annotations CSV once per file mtime.
+    
+    cache_resource returns the same DataFrame without hashing or copying it,
+    so callers must treat it as read-only.
+    """
+    return pd.read_csv(
+        ANNOTATIONS_FILE,
+        usecols=lambda col: col in LOOKUP_COLUMNS,
+        dtype=ANNOT_DTYPES,
+        engine="c"
+    )
+
 def get_annotations_for_rater(rater_id: str):
     """
     Get all annotations by this rater as a dict indexed by item_id (speech_id).
@@ -49,7 +76,7 @@ def get_annotations_for_rater(rater_id: str):
     if not ANNOTATIONS_FILE.exists():
         return {}
     
-    df = pd.read_csv(ANNOTATIONS_FILE)
+    df = _read_annotations(ANNOTATIONS_FILE.stat().st_mtime)
     # If file exists but has no data or missing cols, fail safe
     if df.empty or ("rater_id" not in df.columns) or ("item_id" not in df.columns):
         return {}
@@ -57,11 +84,16 @@ def get_annotations_for_rater(rater_id: str):
     rater_df = df[df['rater_id'] == rater_id]
     
     annotations = {}
-    for _, row in rater_df.iterrows():
-        annotations[row['item_id']] = {
-            'score': int(row['score']),
-            'justification': row['justification']
-        }
+    for item_id, score, justification in zip(
+        rater_df['item_id'].values,
+        rater_df['score'].values,
+        rater_df['justification'].fillna('').values
+    ):
+        annotation = {'justification': justification}
+        # Leave a blank score out so the form falls back to its default
+        if not pd.isna(score):
+            annotation['score'] = int(score)
+        annotations[item_id] = annotation
     
     return annotations
 
@@ -88,8 +120,8 @@ def update_annotation(item_id, rater_id, score, justification, context, statemen
         df.to_csv(ANNOTATIONS_FILE, index=False)
         return
     
-    # Load existing annotations
-    df = pd.read_csv(ANNOTATIONS_FILE)
+    # Load existing annotations (all columns, since the whole file is rewritten)
+    df = pd.read_csv(ANNOTATIONS_FILE, dtype=ANNOT_DTYPES, engine="c")
     
     # Ensure columns exist; if not, re-create with proper schema
     expected_cols = ["item_id", "rater_id", "score", "justification", "context", "statement"]
@@ -1,13 +1,19 @@
+import csv
+import json
+
+ANNOTATION_FIELDS = ['item_id', 'rater_id', 'score', 'justification', 'context', 'statement']
+
 def load_speeches(file_path):
-    import json
     with open(file_path, 'r') as file:
         speeches = json.load(file)
     return speeches
 
 def save_annotations(file_path, annotations):
-    import pandas as pd
-    df = pd.DataFrame(annotations)
-    df.to_csv(file_path, index=False)
+    rows = [tuple(annotation.get(field, '') for field in ANNOTATION_FIELDS) for annotation in annotations]
+    with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as file:
+        writer = csv.writer(file)
+        writer.writerow(ANNOTATION_FIELDS)
+        writer.writerows(rows)
 
 def create_annotation(item_id, rater_id, score, justification, context, statement):
     return {